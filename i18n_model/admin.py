@@ -1,7 +1,16 @@
-from django.conf import settings
+import functools
+
 from django.contrib.auth import get_permission_codename
 from django.forms.models import BaseInlineFormSet
 
+from .models import _NON_DEFAULT_LANG_CHOICES
+
+
+# Language codes that can have translations (the default language is served
+# by the source model itself).
+_NON_DEFAULT = tuple(lang[0] for lang in _NON_DEFAULT_LANG_CHOICES)
+_NON_DEFAULT_SET = frozenset(_NON_DEFAULT)
+
 
 def i18n_formset_factory(languages=[]):
     # Create an ad-hoc form set
@@ -14,26 +23,45 @@ def i18n_formset_factory(languages=[]):
 
 
 class I18nInlineMixin(object):
-    max_num = len(settings.LANGUAGES) - 1
+    max_num = len(_NON_DEFAULT)
+
+    def _cached_translated(self, obj):
+        # Inline instances are created per request, so memoizing on the
+        # instance lets get_formset() and get_extra() share a single query.
+        cache = self.__dict__.setdefault('_i18n_translated', {})
+        if obj.pk not in cache:
+            cache[obj.pk] = set(obj.translations.get_available_languages())
+        return cache[obj.pk]
+
+    def _translated_count(self, obj):
+        if not obj or not obj.pk:
+            return 0
+        # Only count configured languages, rows for languages that were
+        # removed from settings.LANGUAGES must not reduce the extra forms.
+        cache = self.__dict__.get('_i18n_translated', {})
+        if obj.pk in cache:
+            return len(cache[obj.pk] & _NON_DEFAULT_SET)
+        # Only the number is needed, so don't load the translations
+        return obj.translations.filter(i18n_language__in=_NON_DEFAULT).count()
 
     def get_existing_translation(self, obj=None):
         if not obj or not obj.pk:
             return []
-        return obj.translations.get_available_languages()
+        return list(self._cached_translated(obj))
 
     def get_untranslated_languages(self, obj=None):
         if not obj or not obj.pk:
-            return [lang[0] for lang in settings.LANGUAGES
-                    if lang[0] != settings.LANGUAGE_CODE]
-        else:
-            translated = obj.translations.get_available_languages()
-            return [lang[0] for lang in settings.LANGUAGES
-                    if lang[0] not in translated
-                    and lang[0] != settings.LANGUAGE_CODE]
+            return list(_NON_DEFAULT)
+        translated = self._cached_translated(obj)
+        if not translated:
+            return list(_NON_DEFAULT)
+        if translated >= _NON_DEFAULT_SET:
+            return []
+        # Keep the settings.LANGUAGES order for the initial forms
+        return [code for code in _NON_DEFAULT if code not in translated]
 
     def get_extra(self, request, obj=None, **kwargs):
-        existing_translations = self.get_existing_translation(obj)
-        return len(settings.LANGUAGES) - 1 - len(existing_translations)
+        return max(0, len(_NON_DEFAULT) - self._translated_count(obj))
 
     def get_formset(self, request, obj=None, **kwargs):
         untranslated = self.get_untranslated_languages(obj)
@@ -48,21 +76,33 @@ class I18nInlineMixin(object):
     # `I18nModel`s wouldn't have their own permissions - so below we
     # make sure to inherit the permissions of the source model.
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _source_meta(cls):
+        source_field = cls.model._meta.get_field('i18n_source')
+        return source_field.remote_field.model._meta
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _perm(cls, action):
+        # The permission string only depends on the action and the source
+        # model, so it is computed once per inline class.
+        opts = cls._source_meta()
+        codename = get_permission_codename(action, opts)
+        return "%s.%s" % (opts.app_label, codename)
+
     def get_source_meta(self):
-        source_field = self.model._meta.get_field_by_name('i18n_source')[0]
-        return source_field.rel.to._meta
+        return self._source_meta()
 
-    def has_add_permission(self, request):
-        opts = self.get_source_meta()
-        codename = get_permission_codename('add', opts)
-        return request.user.has_perm("%s.%s" % (opts.app_label, codename))
+    def has_add_permission(self, request, obj=None):
+        return request.user.has_perm(self._perm('add'))
 
     def has_change_permission(self, request, obj=None):
-        opts = self.get_source_meta()
-        codename = get_permission_codename('change', opts)
-        return request.user.has_perm("%s.%s" % (opts.app_label, codename))
+        return request.user.has_perm(self._perm('change'))
 
     def has_delete_permission(self, request, obj=None):
-        opts = self.get_source_meta()
-        codename = get_permission_codename('delete', opts)
-        return request.user.has_perm("%s.%s" % (opts.app_label, codename))
+        return request.user.has_perm(self._perm('delete'))
+
+    def has_view_permission(self, request, obj=None):
+        return (request.user.has_perm(self._perm('view')) or
+                request.user.has_perm(self._perm('change')))
@@ -1,4 +1,4 @@
-import copy
+import functools
 
 from django.core.exceptions import ImproperlyConfigured
 from django.conf import settings
@@ -13,18 +13,24 @@ from django.utils.translation import get_language
 __all__ = ['I18nModel', 'I18nManager']
 
 
+# Translations are never stored for the default language.
+_NON_DEFAULT_LANG_CHOICES = tuple(l for l in settings.LANGUAGES
+                                  if l[0] != settings.LANGUAGE_CODE)
+
+# Source model fields that are translated when ``translation_fields`` is not
+# given (``SlugField`` is listed for clarity, it subclasses ``CharField``).
+_TRANSLATABLE = (models.CharField, models.TextField, models.SlugField)
+
+# ``CharField`` subclasses that hold non-text values and are not translated
+# unless listed in ``translation_fields``.
+_NOT_TRANSLATABLE = (models.EmailField, models.URLField)
+
+
 def get_class(classname, modulename):
     from_module = __import__(modulename, globals(), locals(), classname)
     return getattr(from_module, classname)
 
 
-def create_language_method(language_code):
-    """ Creates a manager method that filters given language code """
-    def get_language(self):
-        return self.filter(i18n_language=language_code)
-    return get_language
-
-
 class I18nManager(models.Manager):
     """ The custom manager that adds i18n-related queries
 
@@ -56,20 +62,32 @@ class I18nManager(models.Manager):
     def current_language(self):
         return self.lang()
 
-    def get_by_lang(self, language_code=None):
+    def get_by_lang(self, language_code=None, fields=None):
         language_code = language_code or get_language()
-        return self.get(i18n_language=language_code)
+        queryset = self.filter(i18n_language=language_code)
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset.get()
 
     def get_available_languages(self):
-        return [t.i18n_language for t in self.all()]
+        return list(self.values_list('i18n_language', flat=True))
+
+
+def install_language_methods(manager_class):
+    """ Adds a method filtering by each language code to the manager class
+
+    The methods are partials of ``lang()``, so they share its code object
+    instead of each language getting its own closure.
+    """
+    for language_code, _language_name in settings.LANGUAGES:
+        setattr(manager_class,
+                language_code.replace('-', '_'),
+                functools.partialmethod(manager_class.lang, language_code))
+
 
-    def __new__(cls, *args, **kwargs):
-        for language in settings.LANGUAGES:
-            language_code = language[0]
-            setattr(cls,
-                    language_code.replace('-', '_'),
-                    create_language_method(language_code))
-        return models.Manager.__new__(cls)
+# Install the per-language methods once, rather than on every manager
+# instantiation.
+install_language_methods(I18nManager)
 
 
 class I18nBase(ModelBase):
@@ -81,29 +99,35 @@ class I18nBase(ModelBase):
             # This is not a I18nModel subclass, so ignore it
             return ModelBase.__new__(mcs, name, bases, attrs)
 
-        attr_meta = attrs.get('Meta', None)
+        meta = attrs.get('Meta', None)
+        if meta is None:
+            meta = attrs['Meta'] = type('Meta', (), {})
 
         # First determine what the source model is (and throw if unknown)
 
         # The most straightforward method is to just look for ``source_model``
         # attribute in model's Meta options:
-        source = getattr(attr_meta, 'source_model', None)
+        source = getattr(meta, 'source_model', None)
 
-        # Remove the source_model attribute if any, pass on exception
-        try:
-            del attrs['Meta'].source_model
-        except AttributeError:
-            pass
+        # Now we need to find out what fields from the source model should
+        # be translated. And those should be copied to our model. First look
+        # at the ``translation_fields`` Meta options.
+        fields = getattr(meta, 'translation_fields', [])
+
+        # Remove our custom options, Django does not accept them in Meta
+        for option in ('source_model', 'translation_fields'):
+            if option in vars(meta):
+                delattr(meta, option)
 
-        if source and type(source) in [str]:
+        if isinstance(source, str):
             # The source is a string, so we need to find out what the developer
             # meant by that. Possibly a class or a model.
 
             if '.' in source:
                 # There's a dot in the name, so this is a model name in
                 # ``app.Model`` format, most likely.
-                source = apps.get_model(source.split('.')[0],
-                                   source.split('.')[1])
+                app_label, model_name = source.split('.', 1)
+                source = apps.get_model(app_label, model_name)
 
             else:
                 # Otherwise, let's assume that developer meant just class name.
@@ -126,55 +150,47 @@ class I18nBase(ModelBase):
             # There is still no source for some reason... oh well, time to throw
             raise ImproperlyConfigured('Please specify the source model')
 
-        # Now we need to find out what fields from the source model should
-        # be translated. And those should be copied to our model.
+        if fields:
+            wanted = frozenset(fields)
+            source_fields = [f for f in source._meta.fields
+                             if f.name in wanted]
+        else:
+            # No fields were given, so let's grab all CharField, SlugField,
+            # and TextField from the source model.
+            source_fields = [f for f in source._meta.fields
+                             if isinstance(f, _TRANSLATABLE)
+                             and not isinstance(f, _NOT_TRANSLATABLE)]
+
+        if not source_fields:
+            raise ImproperlyConfigured(
+                'No translatable fields found on %s' % source.__name__)
 
-        # First look at the ``translation_fields`` Meta options
-        fields = getattr(attr_meta, 'translation_fields', [])
+        unique_fields = []
 
-        # Remove translation_fields attribute if any, pass on exception
-        try:
-            del attrs['Meta'].translation_fields
-        except AttributeError:
-            pass
+        # We have the fields we need to copy, so let's copy them over into
+        # our new model.
+        for field in source_fields:
+            new_field = field.clone()
 
-        if not fields:
-            # No fields were found, so let's grab all CharField, SlugField,
-            # and TextField from the source model.
-            fields = [f.name for f in source._meta.fields
-                      if type(f) in [models.TextField,
-                                     models.CharField,
-                                     models.SlugField]]
+            if field._unique:
+                # We don't allow unique fields in translations.
+                new_field._unique = False
+                unique_fields.append(field.name)
 
-        unique_fields = []
+            attrs[field.name] = new_field
 
-        # We have the field names we need to copy, so let's copy them over
-        # into our new model.
-        for field in source._meta.fields:
-            if field.name in fields:
-                attrs[field.name] = copy.deepcopy(field)
-
-                if field._unique:
-                    # We don't allow unique fields in translations.
-                    attrs[field.name]._unique = False
-                    unique_fields.append(field.name)
-
-        # Add unique_together to Meta
-        if hasattr(attr_meta, 'unique_together'):
-            if type(attrs['Meta'].unique_together[0]) in (str):
-                attrs['Meta'].unique_together = (
-                    attrs['Meta'].unique_together,
-                    ('i18n_source', 'i18n_language'))
-            else:
-                attrs['Meta'].unique_together += ('i18n_source',
-                                                  'i18n_language')
-        else:
-            attrs['Meta'].unique_together = (('i18n_source', 'i18n_language'),)
+        # Add unique_together to Meta, normalizing a single flat tuple of
+        # field names the same way Django does
+        unique_together = list(getattr(meta, 'unique_together', ()))
+        if unique_together and isinstance(unique_together[0], str):
+            unique_together = [tuple(unique_together)]
+        unique_together.append(('i18n_source', 'i18n_language'))
 
         # Also include unique fields in unique_together if needed
-        if unique_fields:
-            for field in unique_fields:
-                attrs['Meta'].unique_together += (('i18n_language', field),)
+        unique_together.extend(('i18n_language', field)
+                               for field in unique_fields)
+
+        meta.unique_together = tuple(unique_together)
 
         # Let's also add a reference to the original model
         attrs['i18n_source'] = models.ForeignKey(source,
@@ -251,8 +267,7 @@ class I18nModel(Model, metaclass=I18nBase):
     i18n_language = models.CharField(
         _('language'),
         max_length=10,
-        choices=[l for l in settings.LANGUAGES
-                 if l[0] != settings.LANGUAGE_CODE])
+        choices=_NON_DEFAULT_LANG_CHOICES)
 
     @classmethod
     def translate(cls, source, language, **kwargs):
@@ -260,17 +275,11 @@ class I18nModel(Model, metaclass=I18nBase):
             return cls.objects.get(i18n_source=source,
                                    i18n_language=language)
 
-        try:
-            translation = cls.objects.get(i18n_source=source,
-                                          i18n_language=language)
-            for key, value in kwargs.items():
-                setattr(translation, key, value)
-            translation.save()
-            return translation
-        except cls.DoesNotExist:
-            return cls.objects.create(i18n_source=source,
-                                      i18n_language=language,
-                                      **kwargs)
+        translation, _created = cls.objects.update_or_create(
+            i18n_source=source,
+            i18n_language=language,
+            defaults=kwargs)
+        return translation
 
     def __unicode__(self):
         return _('%s translation for %s') % (self.get_i18n_language_display(),
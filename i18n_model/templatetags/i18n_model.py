@@ -3,24 +3,43 @@ from __future__ import unicode_literals
 from django.template import Library
 from django.conf import settings
 from django.utils.translation import get_language, override
-from django.urls import reverse, resolve
+from django.urls import Resolver404, reverse, resolve
 
 register = Library()
 
 
-@register.simple_tag
-def translate(obj, language=None):
+@register.simple_tag(takes_context=True)
+def translate(context, obj, language=None):
     language = language or get_language()
 
     if language == settings.LANGUAGE_CODE:
         # If the langauge is default return original object
         return obj
 
-    try:
-        return obj.translations.get_by_lang(language)
-    except:
+    if not hasattr(obj, 'translations') or obj.pk is None:
+        # Not a translatable object, or not saved yet so it can't have any
+        # translations
         return obj
 
+    # Resolved translations (including misses, stored as None) are cached for
+    # the duration of the render so repeated tags for the same object hit the
+    # database once, without keeping stale results on the object itself.
+    cache = context.render_context.setdefault('i18n_model_translations', {})
+    key = (obj._meta.label, obj.pk, language)
+    if key in cache:
+        return cache[key] or obj
+
+    prefetched = getattr(obj, '_prefetched_objects_cache', {}).get(
+        'translations')
+    if prefetched is not None:
+        translation = next((t for t in prefetched
+                            if t.i18n_language == language), None)
+    else:
+        translation = obj.translations.filter(i18n_language=language).first()
+
+    cache[key] = translation
+    return translation or obj
+
 
 @register.simple_tag(takes_context=True)
 def translate_url(context, path=None, language=None):
@@ -29,15 +48,22 @@ def translate_url(context, path=None, language=None):
             url = resolve(path)
         else:
             url = context['request'].resolver_match
-    except:
+    except (Resolver404, KeyError):
         return ''
 
-    language = language or get_language()
+    if url is None:
+        # The request was not resolved (e.g. rendering a 404 page)
+        return ''
+
+    url_full_name = url.url_name
+    if url.namespace:
+        url_full_name = '%s:%s' % (url.namespace, url_full_name)
+
+    if not language or language == get_language():
+        # The requested language is already active, no need to override
+        return reverse(url_full_name, args=url.args, kwargs=url.kwargs)
 
     # We need to call override here because the override from the {% language %}
     # tag doesn't affect the reverse() call for some reason.
     with override(language):
-        url_full_name = url.url_name
-        if url.namespace:
-            url_full_name = '%s:%s' % (url.namespace, url_full_name)
         return reverse(url_full_name, args=url.args, kwargs=url.kwargs)